@@ -0,0 +1,109 @@
+"""
+공고 저장 방식별 메모리(RSS) 비교
+dict 레이아웃 (get_all_records) vs GrantStore (__slots__ + intern)
+
+실행: python bench_grant_memory.py --rows 300000
+"""
+
+import gc
+import sys
+import time
+import argparse
+import subprocess
+from grant_store import GRANT_FIELDS, GrantStore
+
+ORGANIZATIONS = ['과학기술정보통신부', '산업통상자원부', '금융위원회', '보건복지부', '교육부',
+                 '농림축산식품부', '창업진흥원', '중소벤처기업부', 'TIPS운영단', '한국사회적기업진흥원']
+KEYWORDS = ['AI,인공지능,머신러닝,기술', '빅데이터,데이터,분석,플랫폼', '핀테크,금융,블록체인,결제',
+            '헬스케어,의료,디지털,바이오', '에듀테크,교육,이러닝,온라인', '초기,창업,사업화,스타트업']
+
+def rss_kb() -> int:
+    """현재 프로세스 RSS (KB)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        import os
+        return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        # /proc 없음 (macOS 등) - 최대 RSS로 대체
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage // 1024 if sys.platform == 'darwin' else usage
+
+def sheet_cell(value: str) -> str:
+    """시트 응답 파싱처럼 셀마다 새 문자열 객체 생성
+
+    상수 문자열을 그대로 넣으면 모든 행이 같은 객체를 공유해서
+    dict 레이아웃도 intern한 것처럼 보이므로 글자 단위로 다시 조립
+    """
+    return ''.join(list(value))
+
+def fake_rows(n: int):
+    """get_all_values() 형태의 가짜 시트 행 (셀마다 별도 문자열 객체, 한 행씩 생성)"""
+    yield list(GRANT_FIELDS)
+    for i in range(n):
+        yield [
+            f'grant-{i:07d}',
+            f'2026년 창업 지원사업 {i}차',
+            sheet_cell(ORGANIZATIONS[i % len(ORGANIZATIONS)]),
+            f'2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}',
+            f'https://www.k-startup.go.kr/web/contents/bizPbancDetail.do?pbancSn={i}',
+            sheet_cell(KEYWORDS[i % len(KEYWORDS)]),
+            f'창업 {i % 7 + 1}년 미만 기업 대상 사업화 지원. 최대 {i % 5 + 1}억원.',
+        ]
+
+def measure(layout: str, n: int, source: str):
+    """한 가지 레이아웃만 로드하고 RSS 증가량 출력 (하위 프로세스에서 실행)
+
+    원본 행 생성 전부터 측정
+    - stream: 행을 만들면서 바로 적재 (main.get_grant_store의 청크 조회와 같은 방식)
+    - list: 전체 행 목록을 먼저 만든 뒤 적재 (get_all_values 한 번 호출과 같은 방식)
+      적재 후 목록을 해제해도 메모리 단편화로 RSS가 잘 줄지 않음
+    """
+    gc.collect()
+    before = rss_kb()
+    start = time.perf_counter()
+
+    rows = fake_rows(n)
+    if source == 'list':
+        rows = iter(list(rows))
+    if layout == 'dict':
+        header = next(rows)
+        grants = [dict(zip(header, row)) for row in rows]
+    else:
+        grants = GrantStore.from_rows(rows)
+    del rows
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    print(f"{layout}\t{len(grants)}\t{rss_kb() - before}\t{elapsed:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='공고 저장 방식별 메모리 비교')
+    parser.add_argument('--rows', type=int, default=300000)
+    parser.add_argument('--layout', choices=['dict', 'store'], help=argparse.SUPPRESS)
+    parser.add_argument('--source', choices=['stream', 'list'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.layout:
+        measure(args.layout, args.rows, args.source)
+        return
+
+    print(f"공고 {args.rows:,}건 로드 시 RSS 증가량 (행 생성 포함)")
+    for source, label in (('stream', '청크 조회 (get_grant_store)'), ('list', '전체 목록 (get_all_values)')):
+        print(f"[{label}]")
+        results = {}
+        for layout in ('dict', 'store'):
+            # 레이아웃마다 새 프로세스 (해제된 메모리 영향 제거)
+            out = subprocess.run(
+                [sys.executable, __file__, '--rows', str(args.rows), '--layout', layout, '--source', source],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            results[layout] = int(out[2])
+            print(f"  {layout:<6} {int(out[2]) / 1024:8.1f} MB  ({out[3]}초)")
+
+        if results['store'] > 0:
+            print(f"  -> dict 대비 {results['dict'] / results['store']:.1f}배 절감")
+
+if __name__ == "__main__":
+    main()
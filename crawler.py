@@ -4,11 +4,16 @@ profiles 시트의 사용자 관심사 기반 공고 수집
 """
 
 import os
+import sys
 import json
+import time
 import hashlib
+import argparse
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Set
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import gspread
 from google.oauth2.service_account import Credentials
 
@@ -18,31 +23,91 @@ from google.oauth2.service_account import Credentials
 
 SPREADSHEET_KEY = os.getenv("SPREADSHEET_KEY")
 GOOGLE_CREDS = json.loads(os.getenv("GOOGLE_SHEETS_CREDENTIALS", "{}"))
+CHECKPOINT_DIR = os.getenv("CRAWLER_CHECKPOINT_DIR", ".crawler_checkpoints")
+# 이보다 오래된 체크포인트는 무시 (주간 실행이므로 지난주 결과를 이어받지 않도록)
+CHECKPOINT_MAX_AGE_HOURS = float(os.getenv("CRAWLER_CHECKPOINT_MAX_AGE_HOURS", "24"))
+
+# Sheets API 호출 횟수 (--profile 출력용) - load 단계에서 여러 스레드가 함께 갱신
+remote_calls = Counter()
+_remote_calls_lock = threading.Lock()
+
+def remote(name: str, func, *args, **kwargs):
+    """Sheets API 호출 (횟수 집계)"""
+    with _remote_calls_lock:
+        remote_calls[name] += 1
+    return func(*args, **kwargs)
+
+_spreadsheet = None
 
 def get_sheets():
-    """Google Sheets 연결"""
-    scope = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
-    creds = Credentials.from_service_account_info(GOOGLE_CREDS, scopes=scope)
-    client = gspread.authorize(creds)
-    return client.open_by_key(SPREADSHEET_KEY)
+    """Google Sheets 연결 (실행 중 1회만 연결)"""
+    global _spreadsheet
+    if _spreadsheet is None:
+        scope = [
+            'https://www.googleapis.com/auth/spreadsheets',
+            'https://www.googleapis.com/auth/drive'
+        ]
+        creds = Credentials.from_service_account_info(GOOGLE_CREDS, scopes=scope)
+        client = gspread.authorize(creds)
+        _spreadsheet = remote('open_by_key', client.open_by_key, SPREADSHEET_KEY)
+    return _spreadsheet
+
+# ============================================
+# 시트 조회
+# ============================================
+
+def read_profiles() -> List[List[str]]:
+    """profiles 시트 전체 행 (실패 시 빈 목록 - 기본 키워드로 진행)"""
+    try:
+        sheet = remote('worksheet', get_sheets().worksheet, "profiles")
+        return remote('get_all_values', sheet.get_all_values)
+    except Exception as e:
+        print(f"⚠️ profiles 조회 실패: {e}")
+        return []
+
+def fetch_grant_ids() -> Set[str]:
+    """grants 시트의 기존 공고 ID (실패 시 예외)"""
+    sheet = remote('worksheet', get_sheets().worksheet, "grants")
+    data = remote('get_all_values', sheet.get_all_values)
+    return {row[0] for row in data[1:] if row and len(row) > 0}
+
+def read_existing_grant_ids() -> Set[str]:
+    """grants 시트의 기존 공고 ID"""
+    try:
+        return fetch_grant_ids()
+    except Exception as e:
+        print(f"⚠️ 기존 공고 조회 실패: {e}")
+    return set()
+
+def load_sheet_data() -> Dict:
+    """profiles와 기존 공고 ID 동시 조회"""
+    print("\n" + "="*60)
+    print("Google Sheets 조회 중...")
+    print("="*60)
+    
+    get_sheets()  # 연결은 먼저 1회
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        profiles = pool.submit(read_profiles)
+        existing_ids = pool.submit(read_existing_grant_ids)
+        data = {
+            'profile_rows': profiles.result(),
+            'existing_ids': sorted(existing_ids.result())
+        }
+    
+    print(f"✅ profiles {max(len(data['profile_rows']) - 1, 0)}행, 기존 공고 {len(data['existing_ids'])}개")
+    return data
 
 # ============================================
 # 사용자 관심사 분석
 # ============================================
 
-def analyze_user_interests():
-    """profiles 시트에서 사용자 관심사 분석"""
+def analyze_user_interests(data: List[List[str]]):
+    """profiles 시트 행에서 사용자 관심사 분석"""
     print("\n" + "="*60)
     print("사용자 관심사 분석 중...")
     print("="*60)
     
     try:
-        sheet = get_sheets().worksheet("profiles")
-        data = sheet.get_all_values()
-        
         if len(data) <= 1:
             print("⚠️ 등록된 사용자 없음")
             return []
@@ -304,8 +369,8 @@ def generate_targeted_grants(priority_keywords: List[str]):
 # Google Sheets 저장
 # ============================================
 
-def save_grants(grants: List[Dict]):
-    """공고 저장"""
+def save_grants(grants: List[Dict], existing_ids: Set[str]):
+    """공고 저장 (신규만 한 번에 추가)"""
     if not grants:
         print("⚠️ 저장할 공고 없음")
         return False
@@ -315,24 +380,14 @@ def save_grants(grants: List[Dict]):
         print("Google Sheets 저장 중...")
         print("="*60)
         
-        sheet = get_sheets().worksheet("grants")
-        
-        # 기존 ID 가져오기
-        existing_ids = set()
-        try:
-            data = sheet.get_all_values()
-            if len(data) > 1:
-                existing_ids = {row[0] for row in data[1:] if row and len(row) > 0}
-        except:
-            pass
-        
         print(f"기존 공고: {len(existing_ids)}개")
         
         # 신규만 저장
-        new_count = 0
-        for grant in grants:
-            if grant['id'] not in existing_ids:
-                sheet.append_row([
+        new_grants = [grant for grant in grants if grant['id'] not in existing_ids]
+        if new_grants:
+            sheet = remote('worksheet', get_sheets().worksheet, "grants")
+            remote('append_rows', sheet.append_rows, [
+                [
                     grant['id'],
                     grant['title'],
                     grant['organization'],
@@ -340,10 +395,13 @@ def save_grants(grants: List[Dict]):
                     grant['url'],
                     grant['keywords'],
                     grant['description']
-                ])
-                new_count += 1
+                ]
+                for grant in new_grants
+            ])
+            for grant in new_grants:
                 print(f"  ✓ {grant['title'][:40]}...")
         
+        new_count = len(new_grants)
         print(f"\n✅ 저장 완료: 신규 {new_count}개")
         if len(grants) - new_count > 0:
             print(f"   (중복 제외: {len(grants) - new_count}개)")
@@ -356,33 +414,163 @@ def save_grants(grants: List[Dict]):
         print(traceback.format_exc())
         return False
 
+# ============================================
+# 파이프라인
+# ============================================
+
+def stage_load(state: Dict, dry_run: bool):
+    return load_sheet_data()
+
+def stage_analyze(state: Dict, dry_run: bool):
+    priority_keywords = analyze_user_interests(state['load']['profile_rows'])
+    if not priority_keywords:
+        print("\n⚠️ 등록된 사용자 없음 - 기본 공고 사용")
+        priority_keywords = ['AI', '핀테크', '창업']
+    return priority_keywords
+
+def stage_generate(state: Dict, dry_run: bool):
+    grants = generate_targeted_grants(state['analyze'])
+    print(f"\n📊 총 공고: {len(grants)}개")
+    return grants
+
+def stage_save(state: Dict, dry_run: bool):
+    grants = state['generate']
+    if 'load' in state['_resumed']:
+        # 이전 실행의 append가 서버에는 반영됐을 수 있으므로 체크포인트 ID 대신 다시 조회
+        existing_ids = fetch_grant_ids()
+    else:
+        existing_ids = set(state['load']['existing_ids'])
+    new_count = sum(1 for grant in grants if grant['id'] not in existing_ids)
+    
+    if dry_run:
+        print(f"\n🧪 dry-run: 신규 {new_count}개 저장 생략")
+    elif grants and not save_grants(grants, existing_ids):
+        raise RuntimeError("공고 저장 실패")
+    return {'new_count': new_count}
+
+# (이름, 함수) - 순서대로 실행, 각 단계 결과는 다음 단계 입력
+STAGES = [
+    ('load', stage_load),
+    ('analyze', stage_analyze),
+    ('generate', stage_generate),
+    ('save', stage_save),
+]
+
+def checkpoint_path(stage: str) -> str:
+    return os.path.join(CHECKPOINT_DIR, f"{stage}.json")
+
+def new_run_id() -> str:
+    return datetime.now().strftime('%Y%m%d-%H%M%S')
+
+def load_checkpoints():
+    """완료된 단계 결과 불러오기 (이전 실행이 실패한 경우) -> (run_id, state)
+
+    같은 실행(run_id)의 단계만 이어받고, CHECKPOINT_MAX_AGE_HOURS보다 오래된 실행은 버림
+    """
+    run_id, state = None, {}
+    for stage, _ in STAGES:
+        path = checkpoint_path(stage)
+        if not os.path.exists(path):
+            break
+        with open(path, encoding='utf-8') as f:
+            payload = json.load(f)
+        
+        if run_id is None:
+            age_hours = (time.time() - payload.get('created', 0)) / 3600
+            if 'run_id' not in payload or age_hours > CHECKPOINT_MAX_AGE_HOURS:
+                print(f"\n⚠️ 오래된 체크포인트 무시 ({payload.get('run_id', '알 수 없음')})")
+                clear_checkpoints()
+                return new_run_id(), {}
+            run_id = payload['run_id']
+        elif payload.get('run_id') != run_id:
+            break
+        state[stage] = payload['result']
+    
+    if run_id is None:
+        return new_run_id(), {}
+    print(f"\n🔁 이전 실행 {run_id} 이어서 진행")
+    return run_id, state
+
+def save_checkpoint(stage: str, run_id: str, result):
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    path = checkpoint_path(stage)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'run_id': run_id, 'created': time.time(), 'result': result}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def clear_checkpoints():
+    for stage, _ in STAGES:
+        path = checkpoint_path(stage)
+        if os.path.exists(path):
+            os.remove(path)
+
+def print_profile(timings: List[tuple]):
+    """단계별 소요 시간 / API 호출 수"""
+    print(f"\n{'='*60}")
+    print("⏱️ 단계별 프로파일")
+    print(f"{'='*60}")
+    for stage, elapsed, calls in timings:
+        print(f"  {stage:<10} {elapsed:8.3f}초   API 호출 {calls}회")
+    total = sum(elapsed for _, elapsed, _ in timings)
+    print(f"  {'합계':<10} {total:8.3f}초   API 호출 {sum(remote_calls.values())}회")
+    for name, count in sorted(remote_calls.items()):
+        print(f"    - {name}: {count}")
+
+def run_pipeline(dry_run: bool = False, profile: bool = False, fresh: bool = False):
+    """단계별 실행 - 단계마다 체크포인트 저장, 실패 시 다음 실행에서 이어서 진행"""
+    # dry-run은 체크포인트를 읽지도 쓰지도 않음
+    use_checkpoints = not dry_run
+    if use_checkpoints and fresh:
+        clear_checkpoints()
+    run_id, state = load_checkpoints() if use_checkpoints else (new_run_id(), {})
+    # 체크포인트에서 이어받은 단계 (체크포인트로 저장하지 않는 키)
+    state['_resumed'] = set(state)
+    timings = []
+    
+    try:
+        for stage, func in STAGES:
+            if stage in state:
+                print(f"\n⏭️ '{stage}' 단계 건너뜀 (체크포인트)")
+                continue
+            
+            calls_before = sum(remote_calls.values())
+            start = time.perf_counter()
+            state[stage] = func(state, dry_run)
+            timings.append((stage, time.perf_counter() - start, sum(remote_calls.values()) - calls_before))
+            
+            if use_checkpoints:
+                save_checkpoint(stage, run_id, state[stage])
+        
+        if use_checkpoints:
+            clear_checkpoints()
+    finally:
+        if profile:
+            print_profile(timings)
+    
+    return state
+
 # ============================================
 # 메인
 # ============================================
 
-def main():
+def main(argv=None):
     """메인 실행"""
+    parser = argparse.ArgumentParser(description="창업지원금 큐레이션 크롤러")
+    parser.add_argument('--dry-run', action='store_true', help="Sheets에 저장하지 않음")
+    parser.add_argument('--profile', action='store_true', help="단계별 소요 시간 / API 호출 수 출력")
+    parser.add_argument('--fresh', action='store_true', help="체크포인트 무시하고 처음부터 실행")
+    args = parser.parse_args(argv)
+    
     print(f"\n{'='*60}")
     print("스마트 창업지원금 큐레이션")
     print(f"시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}")
     
     try:
-        # 1. 사용자 관심사 분석
-        priority_keywords = analyze_user_interests()
-        
-        if not priority_keywords:
-            print("\n⚠️ 등록된 사용자 없음 - 기본 공고 사용")
-            priority_keywords = ['AI', '핀테크', '창업']
-        
-        # 2. 맞춤 공고 생성
-        grants = generate_targeted_grants(priority_keywords)
-        
-        # 3. 저장
-        print(f"\n📊 총 공고: {len(grants)}개")
+        state = run_pipeline(dry_run=args.dry_run, profile=args.profile, fresh=args.fresh)
         
-        if grants:
-            save_grants(grants)
+        if state['generate']:
             print(f"\n{'='*60}")
             print("✅ 큐레이션 완료!")
             print(f"{'='*60}\n")
@@ -394,6 +582,9 @@ def main():
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         print(traceback.format_exc())
+        if not args.dry_run:
+            print(f"💡 다시 실행하면 마지막 완료 단계부터 이어서 진행합니다 ({CHECKPOINT_DIR})")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
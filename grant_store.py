@@ -0,0 +1,103 @@
+"""
+공고 보관소 - 대량 공고 아카이브용 압축 저장
+get_all_records()의 dict 대신 __slots__ 레코드 + 문자열 intern 사용
+"""
+
+import sys
+from typing import List, Dict, Iterable, Iterator, Optional
+
+# grants 시트 컬럼 순서 (save_grants와 동일)
+GRANT_FIELDS = ('id', 'title', 'organization', 'deadline', 'url', 'keywords', 'description')
+
+# 값이 반복되는 컬럼 - intern으로 같은 문자열 객체 공유
+INTERNED_FIELDS = ('organization', 'deadline', 'keywords')
+
+class GrantRecord:
+    """공고 1건 - dict처럼 읽을 수 있어 match_grant에 그대로 전달 가능"""
+
+    __slots__ = GRANT_FIELDS + ('_tokens',)
+
+    def __init__(self, id='', title='', organization='', deadline='', url='', keywords='', description=''):
+        self.id = str(id)
+        self.title = title
+        self.organization = sys.intern(organization)
+        self.deadline = sys.intern(deadline)
+        self.url = url
+        self.keywords = sys.intern(keywords)
+        self.description = description
+        self._tokens = None
+
+    def get(self, key: str, default=None):
+        if key not in self.__slots__:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        # 매칭 토큰 캐시(_tokens) 저장용
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field: getattr(self, field) for field in GRANT_FIELDS}
+
+class GrantStore:
+    """공고 목록 + id 인덱스"""
+
+    def __init__(self):
+        self._records: List[GrantRecord] = []
+        self._index: Dict[str, int] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[List[str]]) -> 'GrantStore':
+        """get_all_values() 결과 (첫 행 = 헤더)로 생성 - 행 이터레이터도 가능"""
+        store = cls()
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return store
+
+        header = [h.strip().lower() for h in first]
+        # 필드별 컬럼 위치 - 헤더에 이름이 없는 필드는 save_grants 컬럼 순서 사용
+        indexes = [
+            header.index(field) if field in header else position
+            for position, field in enumerate(GRANT_FIELDS)
+        ]
+        id_index = indexes[0]
+
+        for row in rows:
+            if id_index >= len(row) or not row[id_index]:
+                continue
+            width = len(row)
+            store.add(GrantRecord(*[row[i] if i < width else '' for i in indexes]))
+        return store
+
+    def add(self, record: GrantRecord):
+        if record.id in self._index:
+            self._records[self._index[record.id]] = record
+        else:
+            self._index[record.id] = len(self._records)
+            self._records.append(record)
+
+    def get(self, grant_id: str) -> Optional[GrantRecord]:
+        i = self._index.get(str(grant_id))
+        return self._records[i] if i is not None else None
+
+    def recent(self, n: int = 20) -> List[GrantRecord]:
+        """최근 n개 (레코드 복사 없이 참조만 반환)"""
+        return self._records[-n:] if n > 0 else []
+
+    def __contains__(self, grant_id) -> bool:
+        return str(grant_id) in self._index
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[GrantRecord]:
+        return iter(self._records)
@@ -5,13 +5,21 @@
 
 import os
 import json
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from slack_bolt import App
 from slack_bolt.adapter.fastapi import SlackRequestHandler
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 import gspread
 from google.oauth2.service_account import Credentials
+from grant_store import GrantStore
+from tokenizer import tokenize, index_tokens
 
 # ============================================
 # 설정
@@ -71,6 +79,8 @@ def save_profile(user_id: str, data: dict):
                 data.get('region', ''),
                 ','.join(data.get('support_types', []))
             ])
+        # 매칭용 키워드 토큰 미리 계산
+        profile_tokens({'user_id': user_id, 'keywords': data['keywords']})
         return True
     except Exception as e:
         print(f"프로필 저장 실패: {e}")
@@ -93,13 +103,47 @@ def get_profile(user_id: str):
     except:
         return None
 
+GRANT_STORE_TTL = 600  # 초 - 공고는 주 1회 크롤러가 추가
+GRANT_READ_CHUNK = 5000  # 한 번에 조회할 행 수
+
+_grant_store = None
+_grant_store_loaded_at = 0.0
+_grant_store_lock = threading.Lock()
+
+def iter_grant_rows(sheet, chunk_size: int = GRANT_READ_CHUNK):
+    """grants 시트를 chunk_size 행씩 조회 (헤더 포함) - 전체 행을 한 번에 올리지 않음"""
+    start = 1
+    while start <= sheet.row_count:
+        end = start + chunk_size - 1
+        yield from sheet.get(f'A{start}:G{end}')
+        start = end + 1
+
+def get_grant_store() -> GrantStore:
+    """전체 공고 (압축 레코드) - 청크 단위로 읽어 적재, GRANT_STORE_TTL 동안 재사용"""
+    global _grant_store, _grant_store_loaded_at
+    with _grant_store_lock:
+        if _grant_store is None or time.monotonic() - _grant_store_loaded_at > GRANT_STORE_TTL:
+            sheet = get_sheets().worksheet("grants")
+            _grant_store = GrantStore.from_rows(iter_grant_rows(sheet))
+            _grant_store_loaded_at = time.monotonic()
+        return _grant_store
+
+def invalidate_grant_store():
+    """공고 추가 후 다음 조회에서 다시 로드"""
+    global _grant_store
+    with _grant_store_lock:
+        _grant_store = None
+
 def get_recent_grants(days=7):
     """최근 공고 조회"""
     try:
-        sheet = get_sheets().worksheet("grants")
-        records = sheet.get_all_records()
+        store = get_grant_store()
         # 최근 N일 필터링 (간단 버전: 그냥 최근 20개)
-        return records[-20:] if len(records) > 20 else records
+        records = store.recent(20)
+        # 매칭용 토큰 미리 계산
+        for record in records:
+            grant_tokens(record)
+        return records
     except:
         return []
 
@@ -117,11 +161,57 @@ def save_grants(grants: List[dict]):
                 grant.get('keywords', ''),
                 grant.get('description', '')
             ])
+        invalidate_grant_store()
         return True
     except Exception as e:
         print(f"공고 저장 실패: {e}")
         return False
 
+# ============================================
+# 토큰화
+# ============================================
+
+# 토큰화 규칙은 tokenizer.py - 여기서는 공고/프로필별 토큰 캐시만 관리
+
+def grant_tokens(grant: dict) -> FrozenSet[str]:
+    """공고 토큰 집합 (제목 + 설명 + 키워드) - 공고 dict에 캐시"""
+    tokens = grant.get('_tokens')
+    if tokens is None:
+        tokens = index_tokens(' '.join([
+            str(grant.get('title', '')),
+            str(grant.get('description', '')),
+            str(grant.get('keywords', ''))
+        ]))
+        grant['_tokens'] = tokens
+    return tokens
+
+def keyword_tokens(keywords: List[str]) -> List[Tuple[str, Optional[FrozenSet[str]]]]:
+    """프로필 키워드별 토큰 집합 [(키워드, 토큰)]
+
+    토큰이 없는 키워드(기호만 있는 경우 등)도 점수 분모에 포함 - 토큰은 None (매칭 안 됨)
+    """
+    result = []
+    for keyword in keywords:
+        keyword = keyword.lower().strip()
+        if not keyword:
+            continue
+        result.append((keyword, frozenset(tokenize(keyword)) or None))
+    return result
+
+# user_id -> (키워드 튜플, 키워드 토큰) - 저장 시 1회 계산
+_profile_tokens: Dict[str, tuple] = {}
+
+def profile_tokens(profile: dict) -> List[Tuple[str, Optional[FrozenSet[str]]]]:
+    """프로필 키워드 토큰 (캐시 우선)"""
+    keywords = tuple(profile.get('keywords', []))
+    cached = _profile_tokens.get(profile.get('user_id', ''))
+    if cached and cached[0] == keywords:
+        return cached[1]
+    tokens = keyword_tokens(list(keywords))
+    if profile.get('user_id'):
+        _profile_tokens[profile['user_id']] = (keywords, tokens)
+    return tokens
+
 # ============================================
 # AI 매칭
 # ============================================
@@ -130,20 +220,14 @@ def match_grant(grant: dict, profile: dict) -> tuple:
     """공고와 프로필 매칭 (점수, 이유) - 키워드 기반"""
     
     try:
-        # 프로필 키워드 (소문자 변환)
-        profile_keywords = [k.lower().strip() for k in profile['keywords']]
+        # 프로필 키워드 토큰 / 공고 토큰 (미리 계산된 집합)
+        profile_keywords = profile_tokens(profile)
+        grant_token_set = grant_tokens(grant)
         
-        # 공고 텍스트 (제목 + 설명 + 키워드)
-        grant_text = ' '.join([
-            grant.get('title', ''),
-            grant.get('description', ''),
-            grant.get('keywords', '')
-        ]).lower()
-        
-        # 키워드 매칭
+        # 키워드 매칭 (키워드의 모든 토큰이 공고에 포함)
         matched = []
-        for keyword in profile_keywords:
-            if keyword in grant_text:
+        for keyword, tokens in profile_keywords:
+            if tokens is not None and tokens <= grant_token_set:
                 matched.append(keyword)
         
         # 매칭도 계산
@@ -326,6 +410,102 @@ def test_matching(ack, command, say):
     
     say(message)
 
+# ============================================
+# 중복 요청 방지 (Slack 재시도)
+# ============================================
+
+IDEMPOTENCY_TTL = 600  # 초 (Slack 재시도는 수 분 안에 끝남)
+IDEMPOTENCY_MAX_SIZE = 2000
+IN_FLIGHT_WAIT_SECONDS = 2.5  # Slack은 3초 안에 응답이 없으면 포기
+
+class IdempotencyCache:
+    """요청 키 -> 처리 결과(Future) 캐시 (TTL + 최대 크기 제한)"""
+    
+    def __init__(self, ttl: float = IDEMPOTENCY_TTL, max_size: int = IDEMPOTENCY_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items = OrderedDict()  # key -> (만료 시각, Future)
+    
+    def _expire(self):
+        # TTL이 모두 같으므로 삽입 순서 = 만료 순서
+        now = time.monotonic()
+        while self._items:
+            key, (expires_at, _) = next(iter(self._items.items()))
+            if expires_at > now:
+                break
+            self._items.popitem(last=False)
+    
+    def get(self, key: str):
+        self._expire()
+        item = self._items.get(key)
+        return item[1] if item else None
+    
+    def put(self, key: str, future):
+        self._expire()
+        self._items[key] = (time.monotonic() + self.ttl, future)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+    
+    def pop(self, key: str, future=None):
+        # future를 주면 그 요청이 등록한 항목일 때만 제거
+        item = self._items.get(key)
+        if item and (future is None or item[1] is future):
+            del self._items[key]
+
+idempotency_cache = IdempotencyCache()
+
+def request_key(body: bytes, content_type: str) -> str:
+    """요청 식별 키 (event_id / trigger_id, 없으면 본문 해시)"""
+    try:
+        if 'application/json' in content_type:
+            data = json.loads(body)
+            if data.get('event_id'):
+                return f"event:{data['event_id']}"
+        else:
+            form = parse_qs(body.decode('utf-8'))
+            if 'payload' in form:
+                # 인터랙션 (모달 제출, 버튼 등)
+                data = json.loads(form['payload'][0])
+            else:
+                # 슬래시 커맨드
+                data = {k: v[0] for k, v in form.items()}
+            if data.get('trigger_id'):
+                return f"trigger:{data['trigger_id']}"
+    except Exception as e:
+        print(f"요청 키 추출 실패: {e}")
+    return f"body:{hashlib.sha256(body).hexdigest()}"
+
+async def handle_once(req: Request):
+    """같은 요청은 한 번만 처리 - 재시도는 진행 중/완료된 결과를 그대로 반환"""
+    body = await req.body()
+    key = request_key(body, req.headers.get('content-type', ''))
+    
+    pending = idempotency_cache.get(key)
+    if pending is not None:
+        print(f"중복 요청 - {key} (재시도: {req.headers.get('x-slack-retry-num', '-')})")
+        try:
+            response = await asyncio.wait_for(asyncio.shield(pending), IN_FLIGHT_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            # 원 요청이 아직 처리 중 - Slack이 나중에 다시 보내면 캐시된 결과 반환
+            return Response(status_code=503)
+        if response is None:
+            # 원 요청 실패 - 다음 재시도에서 다시 처리
+            return Response(status_code=500)
+        return response
+    
+    future = asyncio.get_running_loop().create_future()
+    idempotency_cache.put(key, future)
+    response = None
+    try:
+        response = await handler.handle(req)
+        return response
+    finally:
+        # 예외, 취소(CancelledError) 포함 항상 결과를 알려 대기 중인 재시도가 멈추지 않게
+        if response is None or response.status_code >= 400:
+            # 실패 / 서명 오류 등은 캐시하지 않음
+            idempotency_cache.pop(key, future)
+        future.set_result(response)
+
 # ============================================
 # FastAPI
 # ============================================
@@ -339,19 +519,15 @@ def root():
 
 @api.post("/slack/events")
 async def slack_events(req: Request):
-    body = await req.body()
-    return await handler.handle(req)
+    return await handle_once(req)
 
 @api.post("/slack/commands")
 async def slack_commands(req: Request):
-    body = await req.body()
-    headers = dict(req.headers)
-    return await handler.handle(req)
+    return await handle_once(req)
 
 @api.post("/slack/actions")
 async def slack_actions(req: Request):
-    body = await req.body()
-    return await handler.handle(req)
+    return await handle_once(req)
 
 # ============================================
 # 실행
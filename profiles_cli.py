@@ -0,0 +1,289 @@
+"""
+프로필 대량 가져오기 / 내보내기
+CSV 또는 JSONL <-> profiles 시트 (save_profile과 같은 컬럼 순서)
+
+실행:
+  python profiles_cli.py import founders.csv
+  python profiles_cli.py import founders.jsonl --chunk-size 5000 --dry-run
+  python profiles_cli.py export profiles.jsonl
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import time
+import argparse
+from typing import Dict, Iterator, List, Optional, Tuple
+import gspread
+from google.oauth2.service_account import Credentials
+
+# ============================================
+# 설정
+# ============================================
+
+SPREADSHEET_KEY = os.getenv("SPREADSHEET_KEY")
+GOOGLE_CREDS = json.loads(os.getenv("GOOGLE_SHEETS_CREDENTIALS", "{}"))
+
+# profiles 시트 컬럼 (A~F, save_profile과 동일)
+PROFILE_FIELDS = ['user_id', 'keywords', 'description', 'stage', 'region', 'support_types']
+LIST_FIELDS = ('keywords', 'support_types')
+STAGES = ('예비', '초기', '시드', '시리즈A')
+
+DEFAULT_CHUNK_SIZE = 2000
+
+def get_sheets():
+    """Google Sheets 연결"""
+    creds = Credentials.from_service_account_info(
+        GOOGLE_CREDS,
+        scopes=['https://www.googleapis.com/auth/spreadsheets']
+    )
+    client = gspread.authorize(creds)
+    return client.open_by_key(SPREADSHEET_KEY)
+
+# ============================================
+# 파일 읽기 / 검증
+# ============================================
+
+def detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return 'jsonl' if path.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+def read_records(path: str, fmt: str) -> Iterator[Tuple[int, dict]]:
+    """파일에서 (줄 번호, 레코드) 한 줄씩 읽기"""
+    stream = sys.stdin if path == '-' else open(path, encoding='utf-8-sig', newline='')
+    try:
+        if fmt == 'jsonl':
+            for line_no, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_no, {'_error': f"JSON 파싱 실패: {e}"}
+        else:
+            # 헤더가 1행이므로 데이터는 2행부터
+            for line_no, record in enumerate(csv.DictReader(stream), 2):
+                yield line_no, record
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def split_list(value) -> List[str]:
+    """'AI, SaaS' 또는 ['AI', 'SaaS'] -> ['AI', 'SaaS'] (다른 타입은 ValueError)"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.split(',')
+    elif not isinstance(value, (list, tuple)):
+        raise ValueError(f"문자열 또는 목록이어야 함: {type(value).__name__}")
+    return [str(v).strip() for v in value if str(v).strip()]
+
+def to_row(record: dict) -> List[str]:
+    """레코드 검증 후 시트 행으로 변환 (오류 시 ValueError)"""
+    if not isinstance(record, dict):
+        raise ValueError(f"객체가 아닌 레코드: {type(record).__name__}")
+    if '_error' in record:
+        raise ValueError(record['_error'])
+
+    user_id = str(record.get('user_id') or '').strip()
+    if not user_id:
+        raise ValueError("user_id 없음")
+
+    keywords = split_list(record.get('keywords'))
+    if not keywords:
+        raise ValueError("keywords 없음")
+
+    stage = str(record.get('stage') or '').strip()
+    if stage not in STAGES:
+        raise ValueError(f"stage 값 오류: '{stage}' (허용: {', '.join(STAGES)})")
+
+    return [
+        user_id,
+        ','.join(keywords),
+        str(record.get('description') or '').strip(),
+        stage,
+        str(record.get('region') or '').strip(),
+        ','.join(split_list(record.get('support_types')))
+    ]
+
+# ============================================
+# 가져오기
+# ============================================
+
+def appended_start_row(response) -> Optional[int]:
+    """append_rows 응답의 updatedRange ("'profiles'!A51:F60")에서 시작 행 번호"""
+    try:
+        match = re.search(r'![A-Z]+(\d+)', response['updates']['updatedRange'])
+        return int(match.group(1)) if match else None
+    except (KeyError, TypeError):
+        return None
+
+def read_user_rows(sheet) -> Dict[str, int]:
+    """기존 user_id -> 행 번호 (A열 한 번 조회, 헤더 제외)"""
+    user_ids = sheet.col_values(1)
+    return {uid: i for i, uid in enumerate(user_ids, 1) if i > 1 and uid}
+
+def flush(sheet, updates: List[Tuple[int, List[str]]], appends: List[List[str]]) -> Optional[int]:
+    """청크 단위 쓰기 - 기존 행 갱신 1회 + 신규 행 추가 1회 -> 추가된 첫 행 번호"""
+    if updates:
+        sheet.batch_update([
+            {'range': f'A{row}:F{row}', 'values': [values]}
+            for row, values in updates
+        ])
+    if appends:
+        return appended_start_row(sheet.append_rows(appends))
+    return None
+
+def import_profiles(path: str, fmt: str, chunk_size: int = DEFAULT_CHUNK_SIZE, dry_run: bool = False) -> Dict[str, int]:
+    """CSV/JSONL -> profiles 시트 (user_id 기준으로 갱신 또는 추가)"""
+    start = time.perf_counter()
+    sheet = get_sheets().worksheet("profiles")
+    # dry-run도 조회는 해야 갱신/추가 건수가 실제와 같음
+    row_of = read_user_rows(sheet)
+
+    stats = {'read': 0, 'updated': 0, 'added': 0, 'invalid': 0}
+    updates: List[Tuple[int, List[str]]] = []
+    appends: List[List[str]] = []
+    pending: Dict[str, int] = {}  # 이번 청크의 신규 user_id -> appends 위치
+
+    def write_chunk():
+        if dry_run:
+            # 실제 행 번호는 없지만 이후 같은 user_id는 갱신으로 집계
+            row_of.update((user_id, 0) for user_id in pending)
+            return
+        start_row = flush(sheet, updates, appends)
+        if not pending:
+            return
+        if start_row is None:
+            # 추가 위치를 알 수 없으면 A열 다시 조회
+            row_of.update(read_user_rows(sheet))
+        else:
+            row_of.update((user_id, start_row + i) for user_id, i in pending.items())
+
+    for line_no, record in read_records(path, fmt):
+        stats['read'] += 1
+        try:
+            row = to_row(record)
+        except ValueError as e:
+            stats['invalid'] += 1
+            print(f"  ⚠️ {line_no}행 건너뜀: {e}")
+            continue
+
+        user_id = row[0]
+        if user_id in pending:
+            # 같은 청크에서 추가 예정인 사용자 - 추가할 행을 교체
+            appends[pending[user_id]] = row
+            stats['updated'] += 1
+        elif user_id in row_of:
+            updates.append((row_of[user_id], row))
+            stats['updated'] += 1
+        else:
+            pending[user_id] = len(appends)
+            appends.append(row)
+            stats['added'] += 1
+
+        if len(updates) + len(appends) >= chunk_size:
+            write_chunk()
+            updates, appends, pending = [], [], {}
+            print(f"  ... {stats['read']}행 처리")
+
+    write_chunk()
+
+    stats['seconds'] = round(time.perf_counter() - start, 2)
+    return stats
+
+# ============================================
+# 내보내기
+# ============================================
+
+def iter_sheet_rows(sheet, chunk_size: int) -> Iterator[List[str]]:
+    """profiles 시트를 chunk_size 행씩 범위 조회 (헤더 제외)"""
+    start = 2
+    while start <= sheet.row_count:
+        end = start + chunk_size - 1
+        # 중간에 빈 구간이 있어도 row_count까지 계속 조회
+        rows = sheet.get(f'A{start}:F{end}')
+        for row in rows:
+            if row and row[0]:
+                yield row + [''] * (len(PROFILE_FIELDS) - len(row))
+        start = end + 1
+
+def to_record(row: List[str]) -> dict:
+    """시트 행 -> get_profile과 같은 형태의 dict"""
+    record = dict(zip(PROFILE_FIELDS, row))
+    for field in LIST_FIELDS:
+        record[field] = split_list(record[field])
+    return record
+
+def export_profiles(path: str, fmt: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+    """profiles 시트 -> CSV/JSONL (청크 단위로 읽어 메모리 일정)"""
+    start = time.perf_counter()
+    sheet = get_sheets().worksheet("profiles")
+    stream = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+    count = 0
+
+    try:
+        writer = None
+        if fmt == 'csv':
+            writer = csv.writer(stream)
+            writer.writerow(PROFILE_FIELDS)
+
+        for row in iter_sheet_rows(sheet, chunk_size):
+            if writer:
+                writer.writerow(row[:len(PROFILE_FIELDS)])
+            else:
+                stream.write(json.dumps(to_record(row), ensure_ascii=False) + '\n')
+            count += 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    return {'exported': count, 'seconds': round(time.perf_counter() - start, 2)}
+
+# ============================================
+# 메인
+# ============================================
+
+def positive_int(value: str) -> int:
+    """argparse 타입 - 1 이상의 정수"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 함: {value}")
+    return number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로필 대량 가져오기 / 내보내기")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_import = sub.add_parser('import', help="CSV/JSONL -> profiles 시트")
+    p_import.add_argument('path', help="입력 파일 ('-' = stdin)")
+    p_import.add_argument('--dry-run', action='store_true', help="검증만 하고 저장하지 않음")
+
+    p_export = sub.add_parser('export', help="profiles 시트 -> CSV/JSONL")
+    p_export.add_argument('path', help="출력 파일 ('-' = stdout)")
+
+    for p in (p_import, p_export):
+        p.add_argument('--format', choices=['csv', 'jsonl'], help="기본값: 확장자로 판단")
+        p.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE)
+
+    args = parser.parse_args(argv)
+    fmt = detect_format(args.path, args.format)
+
+    try:
+        if args.command == 'import':
+            stats = import_profiles(args.path, fmt, args.chunk_size, args.dry_run)
+            print(f"✅ 가져오기 완료{' (dry-run)' if args.dry_run else ''}: "
+                  f"읽음 {stats['read']}, 갱신 {stats['updated']}, 추가 {stats['added']}, "
+                  f"오류 {stats['invalid']} ({stats['seconds']}초)")
+        else:
+            stats = export_profiles(args.path, fmt, args.chunk_size)
+            print(f"✅ 내보내기 완료: {stats['exported']}명 ({stats['seconds']}초)", file=sys.stderr)
+    except Exception as e:
+        print(f"❌ 실패: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
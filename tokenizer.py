@@ -0,0 +1,145 @@
+"""
+키워드 매칭용 토큰화
+한글 덩어리 / 영문·숫자 단어 분리, 조사 제거, 복합명사 분해
+
+- tokenize(): 프로필 키워드 쪽 - 단어마다 대표 토큰
+- index_tokens(): 공고 쪽 - 원형 + 조사 뗀 어간 + 분해된 명사를 모두 담은 집합
+키워드 토큰이 모두 공고 토큰 집합에 있으면 일치
+
+>>> matches('ai', 'He said the mail was sent')
+False
+>>> matches('AI', 'AI스타트업 육성')
+True
+>>> matches('데이터', '빅데이터 플랫폼 구축')
+False
+>>> matches('창업', 'AI 반도체 창업기업 지원')
+True
+>>> matches('인공지능', '인공지능기술 개발')
+True
+>>> matches('모바일', '모바일을 위한 지원')
+True
+>>> matches('웹툰', '웹툰제작 지원')
+True
+>>> matches('startup', 'Global startups program')
+True
+>>> matches('전문가', '전문 컨설팅')
+False
+>>> matches('C++', 'c 언어 교육')
+False
+"""
+
+import re
+import sys
+import unicodedata
+from typing import FrozenSet, List, Optional, Set
+
+# 한글 덩어리 / 영문·숫자 단어 분리 ("AI스타트업" -> "ai", "스타트업")
+# 영문은 c++, c#, r&d, node.js 같은 기호 포함 용어를 한 토큰으로 유지
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+(?:[&.][a-z0-9]+)*[+#]*')
+
+# 복합명사에서 추가로 떼어낼 명사 - 매칭 필수 조건이 아니라 분해 보조용
+# "빅데이터"처럼 한 단어로 봐야 하는 것은 통째로 등록 ("데이터"와 구분)
+NOUN_VOCABULARY = frozenset([
+    # 창업 / 지원사업
+    '창업', '창업자', '기업', '스타트업', '벤처', '소셜', '사회적', '중소기업', '소상공인',
+    '예비', '초기', '청년', '지원', '사업', '사업화', '육성', '혁신', '성장', '투자', '엔젤',
+    '멘토링', '교육', '아이템', '시제품', '개발', '개발비', '연구', '기술', '인허가',
+    '계획서', '재무제표', '프로그램', '패키지', '사관학교', '전문가', '글로벌', '해외',
+    '진출', '수출', '판로', '마케팅', '디자인', '시장', '테스트', '플랫폼', '구축', '서비스',
+    '임팩트', '가치', '창출', '측정', '기반', '대상', '기관', '제작', '운영', '활용',
+    # 분야 (crawler.extract_keywords_from_descriptions와 맞춤)
+    '인공지능', '머신러닝', '딥러닝', '빅데이터', '데이터', '분석', '핀테크', '금융', '결제',
+    '블록체인', '암호화폐', '헬스케어', '의료', '기기', '바이오', '건강', '디지털',
+    '이커머스', '커머스', '쇼핑', '유통', '에듀테크', '이러닝', '온라인', '푸드테크',
+    '음식', '배달', '식품', '농업', '모빌리티', '자율주행', '전기차', '교통', '클라우드',
+    '소프트웨어', '하드웨어', '반도체', '메타버스', '가상현실', '사물인터넷', '스마트',
+    '친환경', '지속가능', '그린', '에너지', '환경', '로봇', '드론', '보안', '콘텐츠',
+    '게임', '문화', '관광', '물류', '제조', '소재', '부품', '장비', '디스플레이',
+])
+
+# 명사 뒤에 붙는 조사 (긴 것부터 검사)
+KOREAN_PARTICLES = sorted([
+    '에서', '으로', '에게', '한테', '까지', '부터', '이나', '이랑', '처럼', '보다',
+    '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만', '나', '랑',
+], key=len, reverse=True)
+
+# 조사를 떼고 남는 어간의 최소 글자 수
+MIN_STEM_LENGTH = 2
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize('NFC', str(text)).lower()
+
+def is_hangul(token: str) -> bool:
+    return '가' <= token[0] <= '힣'
+
+def split_compound(word: str) -> List[str]:
+    """사전 명사 기준으로 복합명사 분해 ("웹툰제작" -> "웹툰", "제작")
+
+    사전 명사가 덮는 글자가 가장 많은 분해를 고르고, 사전에 없는 조각은
+    2글자 이상일 때만 허용 ("빅" 같은 한 글자 조각이 남으면 분해하지 않음)
+    """
+    n = len(word)
+    # best[i] = (사전 명사가 덮은 글자 수, -조각 수, 조각 리스트) - word[:i]
+    best = [None] * (n + 1)
+    best[0] = (0, 0, [])
+    for end in range(1, n + 1):
+        for start in range(end):
+            if best[start] is None:
+                continue
+            piece = word[start:end]
+            known = piece in NOUN_VOCABULARY
+            if not known and len(piece) < MIN_STEM_LENGTH:
+                continue
+            covered, neg_pieces, pieces = best[start]
+            candidate = (covered + (len(piece) if known else 0), neg_pieces - 1, pieces + [piece])
+            if best[end] is None or candidate[:2] > best[end][:2]:
+                best[end] = candidate
+    return best[n][2] if best[n] else [word]
+
+def strip_particle(word: str) -> Optional[str]:
+    """끝의 조사를 뗀 어간 (어간 2글자 이상일 때만) - 조사가 없으면 None"""
+    for particle in KOREAN_PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= MIN_STEM_LENGTH:
+            return word[:-len(particle)]
+    return None
+
+def tokenize(text: str) -> List[str]:
+    """키워드 -> 대표 토큰 리스트 (한글은 복합명사 분해, intern)"""
+    if not text:
+        return []
+    tokens = []
+    for token in TOKEN_PATTERN.findall(normalize(text)):
+        if is_hangul(token):
+            tokens.extend(sys.intern(part) for part in split_compound(token))
+        else:
+            tokens.append(sys.intern(token))
+    return tokens
+
+def index_tokens(text: str) -> FrozenSet[str]:
+    """공고 텍스트 -> 매칭용 토큰 집합
+
+    한글은 원형, 조사를 뗀 어간, 각각의 복합명사 분해 조각을 모두 포함
+    영문은 원형과 복수형 's'를 뗀 형태 포함
+    """
+    tokens: Set[str] = set()
+    if not text:
+        return frozenset()
+    for token in TOKEN_PATTERN.findall(normalize(text)):
+        if is_hangul(token):
+            forms = [token]
+            stem = strip_particle(token)
+            if stem:
+                forms.append(stem)
+            for form in forms:
+                tokens.add(sys.intern(form))
+                tokens.update(sys.intern(part) for part in split_compound(form))
+        else:
+            tokens.add(sys.intern(token))
+            if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+                tokens.add(sys.intern(token[:-1]))
+    return frozenset(tokens)
+
+def matches(keyword: str, text: str) -> bool:
+    """키워드 하나가 텍스트와 일치하는지 (토큰이 없는 키워드는 불일치)"""
+    keyword_set = frozenset(tokenize(keyword))
+    return bool(keyword_set) and keyword_set <= index_tokens(text)